@@ -1,23 +1,80 @@
 import os
-import urllib.request
-import random
-import pydub
-import speech_recognition
+import shutil
+import subprocess
+import threading
+import urllib3
 import time
 import logging
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from typing import Any, Callable, Optional
 from DrissionPage import ChromiumPage
 
+# Shared connection pool so repeated audio downloads reuse the TLS connection.
+# The read timeout bounds each socket read, so a stalled download fails fast.
+_HTTP = urllib3.PoolManager(
+    maxsize=4,
+    retries=urllib3.Retry(2),
+    timeout=urllib3.Timeout(connect=5, read=15),
+    headers={"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"},
+)
+
+# Decode MP3 on stdin to raw 16 kHz mono 16-bit PCM on stdout, the format
+# Google's speech API expects, so speech_recognition never has to resample.
+# The binary path is resolved once at import rather than on every spawn.
+_AUDIO_SAMPLE_RATE = 16000
+_AUDIO_SAMPLE_WIDTH = 2
+_FFMPEG_DECODE_CMD = [
+    shutil.which("ffmpeg") or "ffmpeg", "-v", "quiet", "-i", "pipe:0",
+    "-f", "s16le", "-acodec", "pcm_s16le", "-ar", str(_AUDIO_SAMPLE_RATE), "-ac", "1", "pipe:1",
+]
+
+# DrissionPage locators
+_LOC_RECAPTCHA_IFRAME = "@title=reCAPTCHA"
+_LOC_CHALLENGE_IFRAME = "xpath://iframe[contains(@title, 'recaptcha')]"
+_LOC_ANCHOR = ".rc-anchor-content"
+_LOC_AUDIO_BTN = "#recaptcha-audio-button"
+_LOC_AUDIO_SRC = "#audio-source"
+_LOC_AUDIO_RESPONSE = "#audio-response"
+_LOC_VERIFY = "#recaptcha-verify-button"
+_LOC_TOKEN = "#recaptcha-token"
+_LOC_PASSWORD = "tag:input@type=password"
+_LOC_DETECTION_BANNER = (
+    "xpath://*[contains(@class, 'rc-doscaptcha-header-text')"
+    " or contains(text(), 'Try again later')]"
+)
+
+# Browser-side checks evaluated in a single round-trip
+_JS_CHECKMARK_HAS_STYLE = (
+    "const e = document.querySelector('.recaptcha-checkbox-checkmark');"
+    " return !!(e && e.hasAttribute('style'));"
+)
+_JS_PASSWORD_FIELD_VISIBLE = (
+    "const visible = (root) => {"
+    "  for (const el of root.querySelectorAll('*')) {"
+    "    if (el.tagName === 'INPUT' && el.type === 'password' && el.offsetParent !== null) return true;"
+    "    if (el.shadowRoot && visible(el.shadowRoot)) return true;"
+    "  }"
+    "  return false;"
+    "};"
+    " return visible(document);"
+)
+
+
+def _noop(*args, **kwargs) -> None:
+    """Stand-in for debug hooks when verbose mode is disabled."""
+
 
 class RecaptchaSolver:
     """A class to solve reCAPTCHA challenges using audio recognition."""
 
     # Constants
-    TEMP_DIR = os.getenv("TEMP") if os.name == "nt" else "/tmp"
     DEBUG_DIR = "./debug"
     TIMEOUT_STANDARD = 7
     TIMEOUT_SHORT = 1
     TIMEOUT_DETECTION = 0.5
+    # Overall budget for downloading and recognizing the audio challenge
+    TIMEOUT_AUDIO = 60
 
     def __init__(self, driver: ChromiumPage, verbose: bool = False) -> None:
         """Initialize the solver with a ChromiumPage driver.
@@ -28,19 +85,27 @@ class RecaptchaSolver:
         """
         self.driver = driver
         self.verbose = verbose
+        self._recognizer = None  # created on first audio challenge
+        self._cached_token = None
+
+        # Iframe handles cached by solveCaptcha to avoid repeated CDP lookups
+        self._anchor_iframe = None
+        self._challenge_iframe = None
 
-        # Create debug directory if verbose mode is enabled
+        # Create debug directory if verbose mode is enabled, otherwise replace
+        # the debug hooks with no-ops so hot-path calls skip the verbose checks
         if self.verbose:
             os.makedirs(self.DEBUG_DIR, exist_ok=True)
+        else:
+            self._log = self._take_screenshot = _noop
 
     def _log(self, message: str) -> None:
         """Log message if verbose mode is enabled."""
-        if self.verbose:
-            logging.debug(message)
+        logging.debug(message)
 
     def _take_screenshot(self, name: str) -> None:
         """Take a screenshot for debugging (verbose mode only)."""
-        if self.driver and self.verbose:
+        if self.driver:
             try:
                 filename = os.path.join(self.DEBUG_DIR, f"debug_captcha_{name}.png")
                 self.driver.get_screenshot(path=filename)
@@ -48,58 +113,84 @@ class RecaptchaSolver:
             except Exception as e:
                 self._log(f"Failed to take screenshot: {e}")
 
+    def _wait_until(self, predicate: Callable[[], Any], timeout: float = 2.0,
+                    interval: float = 0.05) -> Any:
+        """Poll predicate until it returns a truthy value or the timeout expires.
+
+        Args:
+            predicate: Zero-argument callable checked on every tick
+            timeout: Maximum time to wait in seconds
+            interval: Delay between checks in seconds
+
+        Returns:
+            The first truthy predicate result, or the last (falsy) result on timeout
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            result = predicate()
+            if result:
+                return result
+            if time.monotonic() >= deadline:
+                return result
+            time.sleep(interval)
+
+    def _checkbox_outcome(self) -> Optional[str]:
+        """Report which success indicator is showing after the checkbox click, if any."""
+        if self.login_form_visible():
+            return "login form appeared"
+        if self.is_solved():
+            return "checkmark detected"
+        return None
+
     def solveCaptcha(self) -> None:
         """Attempt to solve the reCAPTCHA challenge.
 
         Raises:
             Exception: If captcha solving fails or bot is detected
         """
+        # A new solve issues a new token
+        self._cached_token = None
 
         # Handle main reCAPTCHA iframe
         self._log("Waiting for reCAPTCHA iframe...")
         self.driver.wait.ele_displayed(
-            "@title=reCAPTCHA", timeout=self.TIMEOUT_STANDARD
+            _LOC_RECAPTCHA_IFRAME, timeout=self.TIMEOUT_STANDARD
         )
-        time.sleep(0.1)
         self._log("Found reCAPTCHA iframe")
-        iframe_inner = self.driver("@title=reCAPTCHA")
+        iframe_inner = self.driver(_LOC_RECAPTCHA_IFRAME)
+        self._anchor_iframe = iframe_inner
 
         # Click the checkbox
         self._log("Waiting for checkbox...")
         iframe_inner.wait.ele_displayed(
-            ".rc-anchor-content", timeout=self.TIMEOUT_STANDARD
+            _LOC_ANCHOR, timeout=self.TIMEOUT_STANDARD
         )
         self._log("Clicking checkbox...")
-        iframe_inner(".rc-anchor-content", timeout=self.TIMEOUT_SHORT).click()
-
-        # Wait for reCAPTCHA to process
-        time.sleep(2)
+        iframe_inner(_LOC_ANCHOR, timeout=self.TIMEOUT_SHORT).click()
 
-        # Check if solved by just clicking
+        # Wait for reCAPTCHA to process - exits as soon as the login form or
+        # checkmark shows, so a pre-rendered form skips the wait entirely
         self._log("Checking if solved by checkbox click...")
-        if self.is_solved():
-            self._log("Captcha solved by checkbox click (checkmark detected)!")
-            return
-
-        # Also check if login form appeared (alternative success indicator)
-        self._log("Checking if login form appeared...")
-        if self.login_form_visible():
-            self._log("Captcha solved by checkbox click (login form appeared)!")
+        outcome = self._wait_until(self._checkbox_outcome, timeout=2.5)
+        if outcome:
+            self._log(f"Captcha solved by checkbox click ({outcome})!")
             return
 
         # Neither worked - proceed to audio challenge
         self._log("Checkbox click insufficient - proceeding to audio challenge...")
         self._log("Looking for audio challenge iframe...")
-        iframe = self.driver("xpath://iframe[contains(@title, 'recaptcha')]")
+        iframe = self.driver(_LOC_CHALLENGE_IFRAME)
+        self._challenge_iframe = iframe
         self._log("Waiting for audio button...")
         iframe.wait.ele_displayed(
-            "#recaptcha-audio-button", timeout=self.TIMEOUT_STANDARD
+            _LOC_AUDIO_BTN, timeout=self.TIMEOUT_STANDARD
         )
         self._log("Clicking audio button...")
-        iframe("#recaptcha-audio-button", timeout=self.TIMEOUT_SHORT).click()
-        time.sleep(0.3)
+        iframe(_LOC_AUDIO_BTN, timeout=self.TIMEOUT_SHORT).click()
         self._take_screenshot("after_audio_button_click")
 
+        # No settle delay needed: the detection probes themselves wait up to
+        # TIMEOUT_DETECTION for the banner to render
         self._log("Checking for bot detection...")
         if self.is_detected():
             self._take_screenshot("bot_detected")
@@ -108,21 +199,20 @@ class RecaptchaSolver:
         # Download and process audio
         self._log("Waiting for audio source...")
         self._take_screenshot("before_audio_source_wait")
-        iframe.wait.ele_displayed("#audio-source", timeout=self.TIMEOUT_STANDARD)
-        src = iframe("#audio-source").attrs["src"]
+        iframe.wait.ele_displayed(_LOC_AUDIO_SRC, timeout=self.TIMEOUT_STANDARD)
+        src = iframe(_LOC_AUDIO_SRC).attrs["src"]
         self._log(f"Audio source found: {src[:50]}...")
 
         try:
             self._log("Processing audio challenge...")
-            text_response = self._process_audio_challenge(src)
+            text_response = self._solve_audio_watching_detection(src)
             self._log(f"Recognized text: {text_response}")
-            iframe("#audio-response").input(text_response.lower())
+            iframe(_LOC_AUDIO_RESPONSE).input(text_response.lower())
             self._log("Clicking verify button...")
-            iframe("#recaptcha-verify-button").click()
-            time.sleep(2.0)
+            iframe(_LOC_VERIFY).click()
 
             self._log("Checking if captcha is solved...")
-            solved = self.is_solved()
+            solved = self._wait_until(self.is_solved, timeout=2.5)
             if not solved:
                 raise Exception("Failed to solve the captcha")
             self._log("Captcha solved successfully!")
@@ -130,6 +220,40 @@ class RecaptchaSolver:
         except Exception as e:
             raise Exception(f"Audio challenge failed: {str(e)}")
 
+    def _solve_audio_watching_detection(self, audio_url: str) -> str:
+        """Run the audio challenge in the background while watching for bot detection.
+
+        reCAPTCHA can show its throttle banner while the audio is being
+        downloaded and recognized, so the page is polled meanwhile and the
+        solve is abandoned as soon as the banner appears.
+
+        Args:
+            audio_url: URL of the audio file to process
+
+        Returns:
+            str: Recognized text from the audio file
+
+        Raises:
+            Exception: If bot detection fires or recognition does not complete
+                within TIMEOUT_AUDIO seconds
+        """
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            future = executor.submit(self._process_audio_challenge, audio_url)
+            deadline = time.monotonic() + self.TIMEOUT_AUDIO
+            while True:
+                try:
+                    return future.result(timeout=self.TIMEOUT_DETECTION)
+                except FuturesTimeoutError:
+                    if self.is_detected():
+                        self._take_screenshot("bot_detected_during_audio")
+                        raise Exception("Captcha detected bot behavior during audio challenge")
+                    if time.monotonic() >= deadline:
+                        raise Exception(f"Audio challenge timed out after {self.TIMEOUT_AUDIO} seconds")
+        finally:
+            # Don't block on an abandoned recognition; the worker finishes on its own
+            executor.shutdown(wait=False)
+
     def _process_audio_challenge(self, audio_url: str) -> str:
         """Process the audio challenge and return the recognized text.
 
@@ -139,43 +263,69 @@ class RecaptchaSolver:
         Returns:
             str: Recognized text from the audio file
         """
-        mp3_path = os.path.join(self.TEMP_DIR, f"{random.randrange(1,1000)}.mp3")
-        wav_path = os.path.join(self.TEMP_DIR, f"{random.randrange(1,1000)}.wav")
-
+        response = _HTTP.request("GET", audio_url, preload_content=False)
         try:
-            urllib.request.urlretrieve(audio_url, mp3_path)
-            sound = pydub.AudioSegment.from_mp3(mp3_path)
-            sound.export(wav_path, format="wav")
+            if response.status != 200:
+                raise Exception(f"Audio download failed: HTTP {response.status}")
+
+            # Decode MP3 straight to 16 kHz mono PCM in memory (no temp files).
+            # The download is streamed into ffmpeg's stdin from a writer thread
+            # so decoding overlaps with the network transfer.
+            proc = subprocess.Popen(
+                _FFMPEG_DECODE_CMD,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+            )
+
+            # A failed download must not reach the recognizer: ffmpeg would
+            # happily decode the truncated MP3 and a wrong answer get submitted
+            download_errors = []
+
+            def feed_ffmpeg():
+                try:
+                    shutil.copyfileobj(response, proc.stdin)
+                except BrokenPipeError:
+                    pass  # ffmpeg exited early; its exit code reports why
+                except Exception as e:
+                    download_errors.append(e)
+                finally:
+                    proc.stdin.close()
+
+            writer = threading.Thread(target=feed_ffmpeg, daemon=True)
+            writer.start()
+            pcm_bytes = proc.stdout.read()
+            writer.join()
+            proc.wait()
+            if download_errors:
+                raise download_errors[0]
+            if proc.returncode != 0:
+                raise Exception(f"ffmpeg failed to decode audio (exit code {proc.returncode})")
+        finally:
+            response.release_conn()
 
-            recognizer = speech_recognition.Recognizer()
-            with speech_recognition.AudioFile(wav_path) as source:
-                audio = recognizer.record(source)
+        # Imported here so the checkbox-only path never pays for speech_recognition
+        import speech_recognition
 
-            return recognizer.recognize_google(audio)
+        if self._recognizer is None:
+            self._recognizer = speech_recognition.Recognizer()
 
-        finally:
-            for path in (mp3_path, wav_path):
-                if os.path.exists(path):
-                    try:
-                        os.remove(path)
-                    except OSError:
-                        pass
+        # recognize_google encodes to FLAC itself before uploading, so hand it
+        # raw PCM directly rather than wrapping a WAV container in AudioFile
+        audio = speech_recognition.AudioData(pcm_bytes, _AUDIO_SAMPLE_RATE, _AUDIO_SAMPLE_WIDTH)
+        return self._recognizer.recognize_google(audio)
 
     def is_solved(self) -> bool:
         """Check if the captcha has been solved successfully."""
         try:
             # Check inside the reCAPTCHA iframe
-            iframe_inner = self.driver("@title=reCAPTCHA", timeout=self.TIMEOUT_SHORT)
-            elem = iframe_inner.ele(".recaptcha-checkbox-checkmark", timeout=self.TIMEOUT_SHORT)
-            attrs = elem.attrs
-            has_style = "style" in attrs
-            if self.verbose:
-                self._log(f"Checkmark element attrs: {attrs}")
-                self._log(f"Has style attribute: {has_style}")
+            # The iframe is cross-origin, so the script runs in the frame's own
+            # context; one round-trip replaces the element lookup + attrs read
+            iframe_inner = self._anchor_iframe or self.driver(_LOC_RECAPTCHA_IFRAME, timeout=self.TIMEOUT_SHORT)
+            has_style = bool(iframe_inner.run_js(_JS_CHECKMARK_HAS_STYLE))
+            self._log(f"Has style attribute: {has_style}")
             return has_style
         except Exception as e:
-            if self.verbose:
-                self._log(f"is_solved() exception: {e}")
+            self._log(f"is_solved() exception: {e}")
             return False
 
     def login_form_visible(self) -> bool:
@@ -183,53 +333,87 @@ class RecaptchaSolver:
 
         This indicates reCAPTCHA was solved and form was revealed.
         """
+        try:
+            # Evaluate visibility in the renderer in one round-trip. The login
+            # form is a Lightning Web Component, so shadow roots are walked too.
+            return bool(self.driver.run_js(_JS_PASSWORD_FIELD_VISIBLE))
+        except Exception as e:
+            self._log(f"login_form_visible() script failed, falling back to element scan: {e}")
+
         try:
             # Look for password input field outside the iframe
             # Using main driver, not iframe
             # Also verify it's actually visible (not hidden or in an iframe)
-            password_fields = self.driver.eles('tag:input@type=password', timeout=1)
+            password_fields = self.driver.eles(_LOC_PASSWORD, timeout=1)
             for field in password_fields:
                 # Check if field is actually displayed (not hidden, not in iframe)
                 if field.states.is_displayed and field.states.is_alive:
-                    if self.verbose:
+                    if self.verbose:  # attr() is a browser round-trip
                         self._log(f"Found visible password field: {field.attr('name')}")
                     return True
             return False
         except Exception as e:
-            if self.verbose:
-                self._log(f"login_form_visible() exception: {e}")
+            self._log(f"login_form_visible() exception: {e}")
             return False
 
-    def is_detected(self) -> bool:
-        """Check if the bot has been detected."""
-        try:
-            # Check main page first
-            elem = self.driver.ele("Try again later", timeout=self.TIMEOUT_DETECTION)
-            if elem:
-                is_displayed = elem.states().is_displayed
-                if self.verbose:
-                    self._log(f"Bot detection check (main page): found={bool(elem)}, displayed={is_displayed}")
-                return is_displayed
-
-            # Check inside reCAPTCHA iframe
-            iframe = self.driver("xpath://iframe[contains(@title, 'recaptcha')]", timeout=self.TIMEOUT_DETECTION)
-            if iframe:
-                elem = iframe.ele("Try again later", timeout=self.TIMEOUT_DETECTION)
-                if elem:
-                    is_displayed = elem.states().is_displayed
-                    if self.verbose:
-                        self._log(f"Bot detection check (iframe): found={bool(elem)}, displayed={is_displayed}")
-                    return is_displayed
+    def _find_detection_message(self, container):
+        """Locate the throttle banner by its stable class, falling back to its text.
 
+        Both conditions live in one XPath so a miss costs a single lookup timeout.
+        """
+        return container.ele(_LOC_DETECTION_BANNER, timeout=self.TIMEOUT_DETECTION)
+
+    def _detected_on_page(self) -> bool:
+        """Check the main page for the bot detection message."""
+        elem = self._find_detection_message(self.driver)
+        if not elem:
             return False
-        except Exception as e:
-            if self.verbose:
-                self._log(f"is_detected() exception: {e}")
+        is_displayed = elem.states.is_displayed
+        self._log(f"Bot detection check (main page): found={bool(elem)}, displayed={is_displayed}")
+        return is_displayed
+
+    def _detected_in_iframe(self) -> bool:
+        """Check inside the reCAPTCHA iframe for the bot detection message."""
+        iframe = self._challenge_iframe or self.driver(
+            _LOC_CHALLENGE_IFRAME, timeout=self.TIMEOUT_DETECTION
+        )
+        if not iframe:
+            return False
+        elem = self._find_detection_message(iframe)
+        if not elem:
+            return False
+        is_displayed = elem.states.is_displayed
+        self._log(f"Bot detection check (iframe): found={bool(elem)}, displayed={is_displayed}")
+        return is_displayed
+
+    def is_detected(self) -> bool:
+        """Check if the bot has been detected.
+
+        The main page and iframe probes run concurrently so the "not detected"
+        path costs one detection timeout instead of one per probe, and a probe
+        that finds the banner returns without waiting for the other.
+        """
+        probes = (self._detected_on_page, self._detected_in_iframe)
+        executor = ThreadPoolExecutor(max_workers=len(probes))
+        try:
+            futures = [executor.submit(probe) for probe in probes]
+            for future in as_completed(futures):
+                try:
+                    if future.result():
+                        return True
+                except Exception as e:
+                    self._log(f"is_detected() exception: {e}")
             return False
+        finally:
+            # Don't block on the other probe's lookup; it finishes on its own
+            executor.shutdown(wait=False, cancel_futures=True)
 
     def get_token(self) -> Optional[str]:
-        """Get the reCAPTCHA token if available."""
+        """Get the reCAPTCHA token if available (cached until the next solve)."""
+        if self._cached_token is not None:
+            return self._cached_token
         try:
-            return self.driver.ele("#recaptcha-token").attrs["value"]
+            self._cached_token = self.driver.ele(_LOC_TOKEN).attrs["value"]
         except Exception:
-            return None
\ No newline at end of file
+            return None
+        return self._cached_token
\ No newline at end of file
@@ -1,17 +1,30 @@
 import requests
+from requests.adapters import HTTPAdapter
+from requests.cookies import create_cookie
+from urllib3.util.retry import Retry
 import json
 import os
 import time
 import csv
 import logging
 import re
+import signal
+import threading
+import xml.etree.ElementTree as ET
 from datetime import datetime, timedelta, timezone
 from zoneinfo import ZoneInfo
 from pathlib import Path
 import argparse
-from myentergy_auth import MyEntergyAuth
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import groupby
 from dotenv import load_dotenv
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -19,19 +32,155 @@ logging.basicConfig(
     datefmt='%Y-%m-%d %H:%M:%S'
 )
 
+# Usage history endpoint and the query parameters that never vary per chunk
+USAGE_PATH = "/myenergy/usage-history-ajax/format/json"
+USAGE_STATIC_PARAMS = {
+    "usageType": "Q",
+    "show_demand": "1",
+}
+
+# On-demand read endpoint and the query parameters that never change between calls
+ODR_PATH = "/myenergy/odr-ajax"
+ODR_STATIC_PARAMS = {
+    "countHourly": "1",
+    "useselectric": "NO",
+    "usesgas": "NO",
+    "usespropane": "NO",
+    "useswater": "NO",
+    "usesreclaim": "NO",
+    "usesirrigation": "NO",
+    "usesktg": "NO",
+    "usesvoltage": "NO",
+    "usageType": "Q",
+    "timePeriod": "DAILY",
+    "overlay_with": "weather",
+    "select-time": "00:00-02:59",
+    "show_demand": "1",
+}
+
+# Account ID patterns in the usage history page, primary then fallback for each
+# <input type="hidden" name="custId" value="CUSTOMER_ID_REMOVED"/>
+_CUST_ID_RE = re.compile(r'name="custId"\s+value="(\d{8})"')
+_CUST_ID_JS_RE = re.compile(r'var premises = \[(\d{8})\]')
+_METER_ID_RE = re.compile(r'name="fuelType"[^>]+value="E-[A-Z0-9]+-([a-f0-9]{40})"')
+_METER_ID_JS_RE = re.compile(r'var amiDates = \{"([a-f0-9]{40})"')
+
+
+def _json_loads(content: bytes):
+    """Decode a JSON response body, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _json_dumps(data) -> bytes:
+    """Encode data as compact JSON bytes, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data)
+    return json.dumps(data).encode('utf-8')
+
+
+def _json_dumps_pretty(data) -> bytes:
+    """Encode data as 2-space indented JSON bytes, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+
+def _day_bounds(day, tz) -> tuple:
+    """Return the first and last instant of a calendar day in the given timezone."""
+    return (
+        datetime.combine(day, datetime.min.time(), tzinfo=tz),
+        datetime.combine(day, datetime.max.time(), tzinfo=tz),
+    )
+
+
+class _CappedRetry(Retry):
+    """Retry policy whose Retry-After waits share the rate-limit wait cap.
+
+    urllib3 otherwise sleeps for whatever Retry-After the server sends.
+    """
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, EntergyDataCollector.RATE_LIMIT_MAX_WAIT)
+
 
 class EntergyDataCollector:
     """Collects energy usage data from MyEntergy API."""
 
-    def __init__(self, cookies: list = None, cookies_file: str = None):
+    # Maximum number of usage chunks fetched concurrently
+    MAX_CONCURRENT_REQUESTS = 4
+    # Maximum number of per-day CSV files written concurrently
+    MAX_CSV_WRITERS = 8
+    # Window size known to work for 15-minute data if a larger request comes back empty
+    FALLBACK_CHUNK_HOURS = 3
+    # Days after which a day's usage data is final and safe to cache on disk
+    USAGE_CACHE_SETTLE_DAYS = 2
+    # Seconds a successful session check / history-only on-demand read is reused
+    VERIFY_SESSION_TTL = 30
+    ODR_HISTORY_TTL = 300
+    # Pause until the rate-limit window resets when fewer requests than this remain
+    RATE_LIMIT_MIN_REMAINING = 5
+    # Longest single rate-limit pause, whether from these headers or Retry-After
+    RATE_LIMIT_MAX_WAIT = 60
+    # (connect, read) timeout in seconds applied to every request
+    HTTP_TIMEOUT = (5, 30)
+    # Token bucket shared by usage fetch workers: sustained requests per second,
+    # and how many may go out back to back after an idle spell
+    REQUEST_RATE = 1.0
+    REQUEST_BURST = 4
+    # ESPI unit-of-measure code for watt-hours
+    ESPI_UOM_WH = "72"
+
+    def __init__(self, cookies: list = None, cookies_file: str = None, cache_dir: str = None,
+                 output_dir: str = "data", timeout: tuple = None):
         """Initialize the data collector.
 
         Args:
             cookies: List of cookie dictionaries
             cookies_file: Path to cookies JSON file (alternative to cookies param)
+            cache_dir: Directory for caching completed days of usage data (disabled if None)
+            output_dir: Directory for saved CSV, XML and on-demand read files (default: data)
+            timeout: (connect, read) request timeout in seconds (default: HTTP_TIMEOUT)
         """
         self.session = requests.Session()
         self.base_url = "https://myentergyadvisor.entergy.com"
+        self.usage_url = f"{self.base_url}{USAGE_PATH}"
+        self.odr_url = f"{self.base_url}{ODR_PATH}"
+        self.cache_dir = cache_dir
+        self.output_dir = output_dir
+        self.timeout = timeout or self.HTTP_TIMEOUT
+
+        # Output directories already created by this collector, so polling
+        # doesn't repeat makedirs on every save
+        self._created_dirs = set()
+
+        # Keep enough pooled connections for concurrent chunk fetches and retry
+        # transient gateway errors instead of losing that chunk. A 429 is retried
+        # after the server's Retry-After delay (at most RATE_LIMIT_MAX_WAIT) when
+        # it sends one.
+        retries = _CappedRetry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        # Usage workers share the host with the XML export that collection runs
+        # alongside them, so pool one connection for each or urllib3 discards
+        # keep-alive connections under load
+        self.session.mount("https://", HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=self.MAX_CONCURRENT_REQUESTS + 1,
+            max_retries=retries
+        ))
+        # A triggered on-demand read physically reads the meter, and Entergy
+        # rate-limits those; a retry after a 5xx or read timeout could trigger
+        # it again, so the on-demand read endpoint never retries
+        self.session.mount(self.odr_url, HTTPAdapter(pool_connections=1, pool_maxsize=1))
 
         # Set common headers
         self.session.headers.update({
@@ -49,6 +198,18 @@ class EntergyDataCollector:
         else:
             raise ValueError("Either cookies or cookies_file must be provided")
 
+        # ETag and parsed payload per usage request, for conditional re-fetches
+        self._usage_etags = {}
+
+        # Usage request token bucket, shared by fetch workers
+        self._request_lock = threading.Lock()
+        self._request_tokens = float(self.REQUEST_BURST)
+        self._tokens_updated_at = time.monotonic()
+
+        # In-process memoization of session checks and history-only reads
+        self._session_verified_at = None
+        self._odr_history_cache = {}
+
         # Load account IDs (cust_id, meter_id)
         self.cust_id = None
         self.meter_id = None
@@ -56,14 +217,17 @@ class EntergyDataCollector:
 
     def _load_cookies_from_list(self, cookies: list) -> None:
         """Load cookies from a list."""
+        # Add Cookie objects straight to the jar, skipping set()'s per-call
+        # argument handling
+        jar = self.session.cookies
         for cookie in cookies:
-            self.session.cookies.set(
+            jar.set_cookie(create_cookie(
                 cookie['name'],
                 cookie['value'],
                 domain=cookie.get('domain', ''),
                 path=cookie.get('path', '/'),
                 secure=cookie.get('secure', False)
-            )
+            ))
 
     def _load_cookies_from_file(self, filepath: str) -> None:
         """Load cookies from a JSON file. Creates empty file if missing."""
@@ -72,13 +236,35 @@ class EntergyDataCollector:
             return
 
         try:
-            with open(filepath, 'r') as f:
-                cookies = json.load(f)
+            with open(filepath, 'rb') as f:
+                cookies = _json_loads(f.read())
             self._load_cookies_from_list(cookies)
         except (json.JSONDecodeError, ValueError):
             logging.warning(f"Cookie file at {filepath} is invalid, will re-authenticate")
             return
 
+    def reload_cookies(self, cookies: list = None, cookies_file: str = None) -> None:
+        """Replace the session cookies after a re-authentication.
+
+        Keeps the existing session, so its connection pool and adapter settings
+        survive a re-authentication.
+
+        Args:
+            cookies: List of cookie dictionaries (e.g. as returned by MyEntergyAuth.login())
+            cookies_file: Path to cookies JSON file (alternative to cookies param)
+        """
+        self.session.cookies.clear()
+        if cookies:
+            self._load_cookies_from_list(cookies)
+        elif cookies_file:
+            self._load_cookies_from_file(cookies_file)
+        else:
+            raise ValueError("Either cookies or cookies_file must be provided")
+
+        # Anything memoized under the old session is stale
+        self._session_verified_at = None
+        self._odr_history_cache.clear()
+
     def _load_account_ids(self) -> None:
         """Load customer ID and meter ID using fallback chain:
         1. Try loading from .entergy_config.json (cached)
@@ -96,8 +282,8 @@ class EntergyDataCollector:
         # Step 1: Try cached config file
         if config_path.exists():
             try:
-                with open(config_path, 'r') as f:
-                    config = json.load(f)
+                with open(config_path, 'rb') as f:
+                    config = _json_loads(f.read())
                 self.cust_id = config.get('cust_id')
                 self.meter_id = config.get('meter_id')
                 if self.cust_id and self.meter_id:
@@ -114,8 +300,8 @@ class EntergyDataCollector:
             self.meter_id = extracted['meter_id']
             # Save for future use
             try:
-                with open(config_path, 'w') as f:
-                    json.dump(extracted, f, indent=2)
+                with open(config_path, 'wb') as f:
+                    f.write(_json_dumps_pretty(extracted))
                 logging.info(f"✓ Account IDs extracted and saved to {config_path}")
             except Exception as e:
                 logging.warning(f"Failed to save config: {e}")
@@ -144,7 +330,7 @@ class EntergyDataCollector:
         try:
             response = self.session.get(
                 f"{self.base_url}/myenergy/usage-history",
-                timeout=30
+                timeout=self.timeout
             )
 
             if response.status_code != 200:
@@ -154,11 +340,10 @@ class EntergyDataCollector:
             html = response.text
 
             # Extract custId from hidden input field
-            # <input type="hidden" name="custId" value="CUSTOMER_ID_REMOVED"/>
-            cust_id_match = re.search(r'name="custId"\s+value="(\d{8})"', html)
+            cust_id_match = _CUST_ID_RE.search(html)
             if not cust_id_match:
                 # Fallback: JavaScript variable
-                cust_id_match = re.search(r'var premises = \[(\d{8})\]', html)
+                cust_id_match = _CUST_ID_JS_RE.search(html)
 
             if not cust_id_match:
                 logging.warning("Could not find custId in page")
@@ -167,10 +352,10 @@ class EntergyDataCollector:
             cust_id = cust_id_match.group(1)
 
             # Extract meterId from fuelType hidden input
-            meter_id_match = re.search(r'name="fuelType"[^>]+value="E-[A-Z0-9]+-([a-f0-9]{40})"', html)
+            meter_id_match = _METER_ID_RE.search(html)
             if not meter_id_match:
                 # Fallback: JavaScript amiDates object
-                meter_id_match = re.search(r'var amiDates = \{"([a-f0-9]{40})"', html)
+                meter_id_match = _METER_ID_JS_RE.search(html)
 
             if not meter_id_match:
                 logging.warning("Could not find meterId in page")
@@ -193,17 +378,30 @@ class EntergyDataCollector:
         Returns:
             bool: True if session is valid, False otherwise
         """
+        # A session confirmed valid moments ago doesn't need another round-trip
+        if (self._session_verified_at is not None
+                and time.monotonic() - self._session_verified_at < self.VERIFY_SESSION_TTL):
+            return True
+
         try:
-            response = self.session.get(
+            # Only the status matters, so stream and close without downloading the page
+            with self.session.get(
                 f"{self.base_url}/myenergy/usage-history",
-                allow_redirects=False
-            )
-            return response.status_code == 200
+                allow_redirects=False,
+                stream=True,
+                timeout=self.timeout
+            ) as response:
+                valid = response.status_code == 200
         except Exception:
-            return False
+            valid = False
+
+        # Only successes are memoized so a failed check is always retried
+        self._session_verified_at = time.monotonic() if valid else None
+        return valid
 
     def get_usage_data(self, start_date: datetime = None, end_date: datetime = None,
-                      fuel_type: str = None, interval: str = "15min") -> dict:
+                      fuel_type: str = None, interval: str = "15min",
+                      chunk_hours: int = 24) -> dict:
         """Get usage data for the specified date range.
 
         Args:
@@ -211,6 +409,7 @@ class EntergyDataCollector:
             end_date: End date for data collection (defaults to now)
             fuel_type: Fuel type identifier from MyEntergy (auto-detected if None)
             interval: Time interval - "15min", "hourly", or "daily"
+            chunk_hours: Hours per request, capped at one day (default: 24)
 
         Returns:
             dict: Usage data with timestamps and values
@@ -220,114 +419,368 @@ class EntergyDataCollector:
         if not start_date:
             start_date = end_date.replace(hour=0, minute=0, second=0, microsecond=0)
 
+        # Chunks never cross midnight since each request names a single date
+        chunks = self._split_range(start_date, end_date, chunk_hours)
+        self._prune_usage_etags()
+
+        # Chunks are independent, so fetch several at once; map() keeps results in order
         all_data = []
-        current_time = start_date
+        with ThreadPoolExecutor(max_workers=self.MAX_CONCURRENT_REQUESTS) as executor:
+            results = executor.map(
+                lambda chunk: self._fetch_usage_range(chunk[0], chunk[1], fuel_type, interval),
+                chunks
+            )
+            for records in results:
+                all_data.extend(records)
 
-        # Process in 3-hour chunks for 15-minute data
-        chunk_hours = 3 if interval == "15min" else 24
+        return {
+            "data": all_data,
+            "start_date": start_date.isoformat(),
+            "end_date": end_date.isoformat(),
+            "total_points": len(all_data)
+        }
 
+    def _prune_usage_etags(self) -> None:
+        """Forget ETags for days old enough to be final.
+
+        Those days are served from the disk cache rather than revalidated, so
+        without pruning a long-running poller would keep every day's payload.
+        """
+        cutoff = (datetime.now() - timedelta(days=self.USAGE_CACHE_SETTLE_DAYS)).strftime("%Y-%m-%d")
+        stale = [key for key in self._usage_etags if dict(key)["date"] < cutoff]
+        for key in stale:
+            del self._usage_etags[key]
+
+    @staticmethod
+    def _split_range(start_date: datetime, end_date: datetime, chunk_hours: int) -> list:
+        """Split a date range into (start, end) chunks that stay within one day."""
+        chunks = []
+        current_time = start_date
         while current_time < end_date:
+            next_midnight = (current_time + timedelta(days=1)).replace(
+                hour=0, minute=0, second=0, microsecond=0
+            )
             chunk_end = min(
                 current_time + timedelta(hours=chunk_hours),
+                next_midnight,
                 end_date
             )
-            time_range = f"{current_time.strftime('%H:%M')}-{chunk_end.strftime('%H:%M')}"
-            formatted_date = current_time.strftime("%m/%d/%Y")
+            chunks.append((current_time, chunk_end))
+            current_time = chunk_end
+        return chunks
 
-            logging.info(f"Fetching data for {current_time.strftime('%Y-%m-%d')} {time_range}")
+    def _usage_cache_path(self, chunk_start: datetime, chunk_end: datetime,
+                          fuel_type: str = None, interval: str = "15min") -> Path:
+        """Return the cache file for a chunk, or None if it must not be cached.
 
-            # API parameters
-            params = {
-                "date": current_time.strftime("%Y-%m-%d"),
-                "usageType": "Q",
-                "timePeriod": interval,
-                "select-time": time_range,
-                "select-date-to": formatted_date,
-                "select-date-from": formatted_date,
-                "show_demand": "1",
-            }
+        Only chunks at least USAGE_CACHE_SETTLE_DAYS old are cached: usage for
+        those days is final, while the most recent days can still be backfilled.
+        """
+        if not self.cache_dir:
+            return None
 
-            # Auto-detect fuel type if not provided
-            if fuel_type:
-                params["fuelType"] = fuel_type
+        today = datetime.now(chunk_end.tzinfo).replace(hour=0, minute=0, second=0, microsecond=0)
+        if chunk_end > today - timedelta(days=self.USAGE_CACHE_SETTLE_DAYS):
+            return None
 
+        meter_key = (self.meter_id or 'unknown')[-8:]
+        # Integer formatting rather than strftime, which re-parses its format each call
+        day_key = f"{chunk_start.year:04d}-{chunk_start.month:02d}-{chunk_start.day:02d}"
+        time_key = f"{chunk_start.hour:02d}{chunk_start.minute:02d}-{chunk_end.hour:02d}{chunk_end.minute:02d}"
+        filename = f"usage_{meter_key}_{day_key}_{time_key}_{interval}_{fuel_type or 'auto'}.json"
+        return Path(self.cache_dir) / filename
+
+    def _fetch_usage_range(self, chunk_start: datetime, chunk_end: datetime,
+                           fuel_type: str = None, interval: str = "15min") -> list:
+        """Fetch a chunk, serving completed days from the on-disk cache when available."""
+        cache_path = self._usage_cache_path(chunk_start, chunk_end, fuel_type, interval)
+        if cache_path and cache_path.exists():
             try:
-                response = self.session.get(
-                    f"{self.base_url}/myenergy/usage-history-ajax/format/json",
-                    params=params
-                )
+                with open(cache_path, 'rb') as f:
+                    records = _json_loads(f.read())
+                logging.info(f"✓ Loaded {len(records)} cached data points for {chunk_start.strftime('%Y-%m-%d')}")
+                return records
+            except (json.JSONDecodeError, ValueError) as e:
+                logging.warning(f"Ignoring invalid cache file {cache_path}: {e}")
 
-                if response.status_code == 200:
-                    data = response.json()
-
-                    if "series_data" in data and len(data["series_data"]) > 0:
-                        series = data["series_data"][0]
-                        if "data" in series:
-                            timestamps = data.get("column_fulldates", [])
-                            data_points = series["data"]
-
-                            for ts, dp in zip(timestamps, data_points):
-                                try:
-                                    ts_str = ts.split(" GMT")[0]
-                                    timestamp = datetime.strptime(ts_str, "%Y-%m-%d %H:%M:%S")
-                                    all_data.append({
-                                        "timestamp": timestamp.isoformat(),
-                                        "usage_kwh": dp
-                                    })
-                                except Exception as e:
-                                    logging.warning(f" Error processing timestamp {ts}: {e}")
-
-                            logging.info(f"✓ Retrieved {len(data_points)} data points")
-                else:
-                    logging.error(f"✗ API returned status {response.status_code}")
+        records, complete = self._fetch_usage_records(chunk_start, chunk_end, fuel_type, interval)
+
+        # A day with any failed request is returned but not cached, so the
+        # missing windows are fetched again next time
+        if cache_path and records and complete:
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                # Write then rename so another process sharing the cache
+                # directory never reads a half-written file
+                tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+                with open(tmp_path, 'wb') as f:
+                    f.write(_json_dumps(records))
+                os.replace(tmp_path, cache_path)
             except Exception as e:
-                logging.error(f"✗ Error fetching data: {e}")
+                logging.warning(f"Failed to write cache file {cache_path}: {e}")
 
-            current_time = chunk_end
-            time.sleep(1)  # Rate limiting
+        return records
 
-        return {
-            "data": all_data,
-            "start_date": start_date.isoformat(),
-            "end_date": end_date.isoformat(),
-            "total_points": len(all_data)
+    def _fetch_usage_records(self, chunk_start: datetime, chunk_end: datetime,
+                             fuel_type: str = None, interval: str = "15min") -> tuple:
+        """Fetch a chunk, falling back to smaller requests if a larger window returns nothing.
+
+        Returns:
+            tuple: (records, complete) where complete is False if any request failed
+        """
+        records = self._fetch_usage_chunk(chunk_start, chunk_end, fuel_type, interval)
+        if records or interval != "15min" or chunk_end - chunk_start <= timedelta(hours=self.FALLBACK_CHUNK_HOURS):
+            return records or [], records is not None
+
+        logging.info(f"No data for {chunk_start.strftime('%Y-%m-%d')} as one request, retrying in {self.FALLBACK_CHUNK_HOURS}-hour chunks")
+        records = []
+        complete = True
+        for sub_start, sub_end in self._split_range(chunk_start, chunk_end, self.FALLBACK_CHUNK_HOURS):
+            sub_records = self._fetch_usage_chunk(sub_start, sub_end, fuel_type, interval)
+            if sub_records is None:
+                complete = False
+            else:
+                records.extend(sub_records)
+        return records, complete
+
+    def _fetch_usage_chunk(self, chunk_start: datetime, chunk_end: datetime,
+                           fuel_type: str = None, interval: str = "15min") -> list:
+        """Fetch and parse usage data for a single time chunk.
+
+        Args:
+            chunk_start: Start of the chunk
+            chunk_end: End of the chunk
+            fuel_type: Fuel type identifier from MyEntergy (auto-detected if None)
+            interval: Time interval - "15min", "hourly", or "daily"
+
+        Returns:
+            list: Records with 'timestamp' and 'usage_kwh' keys, or None if the request failed
+        """
+        records = []
+        # A chunk ending at midnight covers the rest of the day
+        end_label = f"{chunk_end.hour:02d}:{chunk_end.minute:02d}" if chunk_end.date() == chunk_start.date() else "23:59"
+        time_range = f"{chunk_start.hour:02d}:{chunk_start.minute:02d}-{end_label}"
+        # One format call; the MM/DD/YYYY form is sliced from YYYY-MM-DD
+        ymd = chunk_start.strftime("%Y-%m-%d")
+        formatted_date = f"{ymd[5:7]}/{ymd[8:10]}/{ymd[0:4]}"
+
+        logging.info(f"Fetching data for {ymd} {time_range}")
+
+        # API parameters
+        params = {
+            **USAGE_STATIC_PARAMS,
+            "date": ymd,
+            "timePeriod": interval,
+            "select-time": time_range,
+            "select-date-to": formatted_date,
+            "select-date-from": formatted_date,
         }
 
-    def save_to_csv(self, data: dict, output_dir: str = "data") -> list:
+        # Auto-detect fuel type if not provided
+        if fuel_type:
+            params["fuelType"] = fuel_type
+
+        # Revalidate previously seen chunks (e.g. the current day while polling)
+        # so an unchanged payload comes back as a 304 and isn't parsed again
+        cache_key = tuple(sorted(params.items()))
+        cached = self._usage_etags.get(cache_key)
+        headers = {"If-None-Match": cached[0]} if cached else None
+
+        try:
+            self._throttle()
+            response = self.session.get(
+                self.usage_url,
+                params=params,
+                headers=headers,
+                timeout=self.timeout
+            )
+
+            self._respect_rate_limit(response)
+
+            if response.status_code == 304 and cached:
+                data = cached[1]
+                logging.debug(f"Usage data for {params['date']} {time_range} unchanged (304)")
+            elif response.status_code == 200:
+                data = _json_loads(response.content)
+                etag = response.headers.get("ETag")
+                if etag:
+                    self._usage_etags[cache_key] = (etag, data)
+            else:
+                data = None
+
+            if data is not None:
+                if "series_data" in data and len(data["series_data"]) > 0:
+                    series = data["series_data"][0]
+                    if "data" in series:
+                        timestamps = data.get("column_fulldates", [])
+                        data_points = series["data"]
+
+                        for ts, dp in zip(timestamps, data_points):
+                            try:
+                                # "YYYY-MM-DD HH:MM:SS GMT..." has a fixed-width date part, so
+                                # slice it rather than splitting, then use fromisoformat's C
+                                # fast path rather than strptime's format interpreter
+                                ts_str = ts[:19] if ts[19:23] == " GMT" else ts.split(" GMT")[0]
+                                timestamp = datetime.fromisoformat(ts_str)
+                                records.append({
+                                    "timestamp": timestamp.isoformat(),
+                                    "usage_kwh": dp
+                                })
+                            except Exception as e:
+                                logging.warning(f" Error processing timestamp {ts}: {e}")
+
+                        logging.info(f"✓ Retrieved {len(data_points)} data points")
+            else:
+                logging.error(f"✗ API returned status {response.status_code}")
+                return None
+        except Exception as e:
+            logging.error(f"✗ Error fetching data: {e}")
+            return None
+
+        return records
+
+    def _throttle(self) -> None:
+        """Take a token from the shared bucket, sleeping until one is available.
+
+        Tokens refill at REQUEST_RATE per second up to REQUEST_BURST, so requests
+        after an idle spell (e.g. between polls) go out immediately while a long
+        backfill settles at REQUEST_RATE. A worker that finds the bucket empty
+        reserves its token (the count goes negative) and sleeps outside the lock.
+        """
+        with self._request_lock:
+            now = time.monotonic()
+            self._request_tokens = min(
+                float(self.REQUEST_BURST),
+                self._request_tokens + (now - self._tokens_updated_at) * self.REQUEST_RATE
+            )
+            self._tokens_updated_at = now
+            self._request_tokens -= 1
+            wait = -self._request_tokens / self.REQUEST_RATE if self._request_tokens < 0 else 0
+        if wait:
+            time.sleep(wait)
+
+    def _respect_rate_limit(self, response) -> None:
+        """Sleep until the rate-limit window resets if the server says it is nearly spent.
+
+        Only acts on X-RateLimit-Remaining / X-RateLimit-Reset headers when the
+        server sends them; 429 responses are retried by the session's adapter.
+        """
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        reset = response.headers.get("X-RateLimit-Reset")
+        if remaining is None or reset is None:
+            return
+
+        try:
+            if int(remaining) >= self.RATE_LIMIT_MIN_REMAINING:
+                return
+            reset = float(reset)
+        except ValueError:
+            return
+
+        # Reset is either an epoch timestamp or a number of seconds to wait
+        now = time.time()
+        wait = reset - now if reset > now else reset
+        wait = min(max(wait, 0), self.RATE_LIMIT_MAX_WAIT)
+        if wait:
+            logging.info(f"Rate limit nearly exhausted ({remaining} left), waiting {wait:.0f}s")
+            time.sleep(wait)
+
+    def _ensure_dir(self, path: str) -> str:
+        """Create a directory the first time this collector writes to it."""
+        if path not in self._created_dirs:
+            os.makedirs(path, exist_ok=True)
+            self._created_dirs.add(path)
+        return path
+
+    def save_to_csv(self, data: dict, output_dir: str = None) -> list:
         """Save usage data to CSV files (one per day).
 
         Args:
             data: Usage data dictionary from get_usage_data()
-            output_dir: Directory to save CSV files
+            output_dir: Directory to save CSV files (defaults to the collector's output_dir)
 
         Returns:
             list: Paths to created CSV files
         """
-        os.makedirs(output_dir, exist_ok=True)
-
-        # Group data by day
-        data_by_day = {}
-        for record in data["data"]:
-            timestamp = datetime.fromisoformat(record["timestamp"])
-            day_key = timestamp.strftime("%Y-%m-%d")
-            if day_key not in data_by_day:
-                data_by_day[day_key] = []
-            data_by_day[day_key].append(record)
-
-        # Save each day to separate CSV
-        created_files = []
-        for day_key, day_records in data_by_day.items():
-            filename = os.path.join(output_dir, f"entergy_usage_{day_key}.csv")
-            with open(filename, 'w', newline='') as csvfile:
-                fieldnames = ['timestamp', 'usage_kwh']
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(day_records)
-            logging.info(f"✓ Saved {len(day_records)} records to {filename}")
-            created_files.append(filename)
+        output_dir = self._ensure_dir(output_dir or self.output_dir)
+
+        # Group data by day. ISO timestamps start with YYYY-MM-DD, so slicing gives
+        # the day without re-parsing. Records arrive in chronological order, and
+        # sorting the naive local timestamps would interleave the repeated hour
+        # on the autumn DST change, so group them as they come
+        days = [(day_key, list(group)) for day_key, group in groupby(data["data"], key=lambda r: r["timestamp"][:10])]
+        if not days:
+            return []
+
+        # Save each day to separate CSV; each file is independent, so write them
+        # in parallel (map() keeps the returned paths in day order)
+        with ThreadPoolExecutor(max_workers=min(self.MAX_CSV_WRITERS, len(days))) as executor:
+            created_files = list(executor.map(
+                lambda day: self._write_day_csv(day[0], day[1], output_dir),
+                days
+            ))
 
         return created_files
 
+    @staticmethod
+    def _write_day_csv(day_key: str, day_records: list, output_dir: str) -> str:
+        """Write one day's records to its CSV file.
+
+        Args:
+            day_key: Day in YYYY-MM-DD format
+            day_records: Records for that day
+            output_dir: Directory to save the CSV file
+
+        Returns:
+            str: Path to the created CSV file
+        """
+        filename = os.path.join(output_dir, f"entergy_usage_{day_key}.csv")
+        with open(filename, 'w', newline='') as csvfile:
+            # Plain csv.writer over tuples avoids DictWriter's per-row field lookups
+            writer = csv.writer(csvfile)
+            writer.writerow(('timestamp', 'usage_kwh'))
+            writer.writerows((r['timestamp'], r['usage_kwh']) for r in day_records)
+        logging.info(f"✓ Saved {len(day_records)} records to {filename}")
+        return filename
+
+    def _green_button_url(self, start_date, end_date, fuel_type='E', interval_length='MONTHLY'):
+        """Build the Green Button XML download URL.
+
+        Args:
+            start_date: Start date as string in YYYY-MM-DD format or datetime object
+            end_date: End date as string in YYYY-MM-DD format or datetime object
+            fuel_type: 'E' for electricity, 'G' for gas (default: 'E')
+            interval_length: 'MONTHLY' or 'DAILY' (default: 'MONTHLY')
+
+        Returns:
+            str: Download URL
+        """
+        # Convert dates to MM-DD-YYYY format if they're not already strings
+        if hasattr(start_date, 'strftime'):  # datetime object
+            start_date_str = start_date.strftime('%m-%d-%Y')
+        else:  # string in YYYY-MM-DD format
+            date_obj = datetime.strptime(str(start_date).split()[0], '%Y-%m-%d')
+            start_date_str = date_obj.strftime('%m-%d-%Y')
+
+        if hasattr(end_date, 'strftime'):  # datetime object
+            end_date_str = end_date.strftime('%m-%d-%Y')
+        else:  # string in YYYY-MM-DD format
+            date_obj = datetime.strptime(str(end_date).split()[0], '%Y-%m-%d')
+            end_date_str = date_obj.strftime('%m-%d-%Y')
+
+        # Build the endpoint URL with properly formatted dates
+        return (
+            f"https://myentergyadvisor.entergy.com/cassandra/getfile/"
+            f"period/custom/"
+            f"start_date/{start_date_str}/"
+            f"to_date/{end_date_str}/"
+            f"format/xml/"
+            f"fuel_type/{fuel_type}/"
+            f"backup_meter_id_owh/{self.meter_id}/"
+            f"from_usage/1/"
+            f"interval_length/{interval_length}"
+        )
+
     def get_green_button_xml(self, start_date, end_date, fuel_type='E', interval_length='MONTHLY'):
         """
         Download Green Button XML data from Entergy.
@@ -342,40 +795,14 @@ class EntergyDataCollector:
             bytes: XML content if successful, None if failed
         """
         try:
-            from datetime import datetime
-            
-            # Convert dates to MM-DD-YYYY format if they're not already strings
-            if hasattr(start_date, 'strftime'):  # datetime object
-                start_date_str = start_date.strftime('%m-%d-%Y')
-            else:  # string in YYYY-MM-DD format
-                date_obj = datetime.strptime(str(start_date).split()[0], '%Y-%m-%d')
-                start_date_str = date_obj.strftime('%m-%d-%Y')
-            
-            if hasattr(end_date, 'strftime'):  # datetime object
-                end_date_str = end_date.strftime('%m-%d-%Y')
-            else:  # string in YYYY-MM-DD format
-                date_obj = datetime.strptime(str(end_date).split()[0], '%Y-%m-%d')
-                end_date_str = date_obj.strftime('%m-%d-%Y')
-            
-            # Build the endpoint URL with properly formatted dates
-            url = (
-                f"https://myentergyadvisor.entergy.com/cassandra/getfile/"
-                f"period/custom/"
-                f"start_date/{start_date_str}/"
-                f"to_date/{end_date_str}/"
-                f"format/xml/"
-                f"fuel_type/{fuel_type}/"
-                f"backup_meter_id_owh/{self.meter_id}/"
-                f"from_usage/1/"
-                f"interval_length/{interval_length}"
-            )
-            
+            url = self._green_button_url(start_date, end_date, fuel_type, interval_length)
+
             logging.info(f"Fetching XML from: {url}")
-            response = self.session.get(url, timeout=30)
+            response = self.session.get(url, timeout=self.timeout)
             
             if response.status_code == 200:
-                # Verify it's valid XML
-                if response.text.startswith('<?xml'):
+                # Verify it's valid XML (compare bytes; no need to decode the whole body)
+                if response.content.startswith(b'<?xml'):
                     logging.info(f"✓ Successfully downloaded {len(response.content)} bytes of XML data")
                     return response.content
                 else:
@@ -389,6 +816,112 @@ class EntergyDataCollector:
             logging.error(f"✗ Error downloading XML: {e}")
             return None
 
+    def download_green_button_xml(self, start_date, end_date, filepath, fuel_type='E', interval_length='MONTHLY'):
+        """
+        Stream Green Button XML data straight to a file.
+
+        The body is written chunk by chunk as it arrives rather than being
+        held in memory, and a partial file is removed if the download fails.
+
+        Args:
+            start_date: Start date as string in YYYY-MM-DD format or datetime object
+            end_date: End date as string in YYYY-MM-DD format or datetime object
+            filepath: Destination file path
+            fuel_type: 'E' for electricity, 'G' for gas (default: 'E')
+            interval_length: 'MONTHLY' or 'DAILY' (default: 'MONTHLY')
+
+        Returns:
+            str: Path to the saved file if successful, None if failed
+        """
+        try:
+            url = self._green_button_url(start_date, end_date, fuel_type, interval_length)
+
+            logging.info(f"Fetching XML from: {url}")
+            with self.session.get(url, timeout=self.timeout, stream=True) as response:
+                if response.status_code != 200:
+                    logging.error(f"✗ Error: HTTP {response.status_code}")
+                    return None
+
+                chunks = response.iter_content(chunk_size=64 * 1024)
+                first_chunk = next(chunks, b'')
+
+                # Verify it's valid XML before creating the file
+                if not first_chunk.startswith(b'<?xml'):
+                    logging.error("✗ Error: Response does not appear to be valid XML")
+                    return None
+
+                size = 0
+                try:
+                    with open(filepath, 'wb') as f:
+                        f.write(first_chunk)
+                        size += len(first_chunk)
+                        for chunk in chunks:
+                            f.write(chunk)
+                            size += len(chunk)
+                except Exception:
+                    if os.path.exists(filepath):
+                        os.remove(filepath)
+                    raise
+
+            logging.info(f"✓ Successfully downloaded {size} bytes of XML data")
+            return filepath
+
+        except Exception as e:
+            logging.error(f"✗ Error downloading XML: {e}")
+            return None
+
+    def iter_green_button_readings(self, start_date, end_date, interval_length='MONTHLY'):
+        """
+        Stream Green Button electricity interval readings without loading the whole document.
+
+        The XML is parsed incrementally from the response body and each element
+        is discarded once read, so memory use stays flat regardless of range.
+        On failure the error is logged and iteration stops early.
+
+        Args:
+            start_date: Start date as string in YYYY-MM-DD format or datetime object
+            end_date: End date as string in YYYY-MM-DD format or datetime object
+            interval_length: 'MONTHLY' or 'DAILY' (default: 'MONTHLY')
+
+        Yields:
+            tuple: (timestamp as UTC datetime, usage in kWh)
+        """
+        try:
+            url = self._green_button_url(start_date, end_date, 'E', interval_length)
+
+            logging.info(f"Streaming XML from: {url}")
+            with self.session.get(url, timeout=self.timeout, stream=True) as response:
+                if response.status_code != 200:
+                    logging.error(f"✗ Error: HTTP {response.status_code}")
+                    return
+
+                response.raw.decode_content = True
+                # Interval values are scaled by the ReadingType's power-of-ten multiplier.
+                # Summary measurements carry their own multiplier and unit, so only the
+                # ReadingType's are used
+                multiplier = 0
+                for _, elem in ET.iterparse(response.raw, events=('end',)):
+                    tag = elem.tag.rsplit('}', 1)[-1]
+                    if tag == 'ReadingType':
+                        uom = elem.findtext('{*}uom')
+                        if uom is not None and uom.strip() != self.ESPI_UOM_WH:
+                            logging.error(f"✗ Error: Unsupported unit of measure {uom.strip()} (expected Wh)")
+                            return
+                        multiplier = int(elem.findtext('{*}powerOfTenMultiplier') or 0)
+                        elem.clear()
+                    elif tag == 'IntervalReading':
+                        start = elem.find('.//{*}timePeriod/{*}start')
+                        value = elem.find('{*}value')
+                        if start is not None and value is not None:
+                            timestamp = datetime.fromtimestamp(int(start.text), tz=timezone.utc)
+                            yield timestamp, int(value.text) * (10 ** multiplier) / 1000
+                        elem.clear()
+                    elif tag == 'IntervalBlock':
+                        elem.clear()
+
+        except Exception as e:
+            logging.error(f"✗ Error streaming XML: {e}")
+
     def save_green_button_xml(self, start_date, end_date, filename=None, fuel_type='E', interval_length='MONTHLY'):
         """
         Download and save Green Button XML data.
@@ -396,36 +929,27 @@ class EntergyDataCollector:
         Args:
             start_date: Start date as string in YYYY-MM-DD format or datetime object
             end_date: End date as string in YYYY-MM-DD format or datetime object
-            filename: Output filename (default: greenbutton_{start_date}_{end_date}.xml)
+            filename: Output filename (default: {start_date}_{end_date}.xml)
             fuel_type: 'E' for electricity, 'G' for gas (default: 'E')
             interval_length: 'MONTHLY' or 'DAILY' (default: 'MONTHLY')
         """
-        from datetime import datetime
-        import os
-        
-        xml_data = self.get_green_button_xml(start_date, end_date, fuel_type, interval_length)
-        
-        if xml_data:
-            if filename is None:
-                # Convert dates to clean format for filename
-                if hasattr(start_date, 'strftime'):  # datetime object
-                    start_str = start_date.strftime('%Y-%m-%d')
-                else:  # string
-                    start_str = str(start_date).split()[0]  # Get just the date part
-                
-                if hasattr(end_date, 'strftime'):  # datetime object
-                    end_str = end_date.strftime('%Y-%m-%d')
-                else:  # string
-                    end_str = str(end_date).split()[0]  # Get just the date part
-                
-                filename = f"{start_str}_{end_str}.xml"
-            
-            # Create data directory if it doesn't exist
-            os.makedirs('data', exist_ok=True)
-            filepath = os.path.join('data', filename)
-            
-            with open(filepath, 'wb') as f:
-                f.write(xml_data)
+        if filename is None:
+            # Convert dates to clean format for filename
+            if hasattr(start_date, 'strftime'):  # datetime object
+                start_str = start_date.strftime('%Y-%m-%d')
+            else:  # string
+                start_str = str(start_date).split()[0]  # Get just the date part
+
+            if hasattr(end_date, 'strftime'):  # datetime object
+                end_str = end_date.strftime('%Y-%m-%d')
+            else:  # string
+                end_str = str(end_date).split()[0]  # Get just the date part
+
+            filename = f"{start_str}_{end_str}.xml"
+
+        filepath = os.path.join(self._ensure_dir(self.output_dir), filename)
+
+        if self.download_green_button_xml(start_date, end_date, filepath, fuel_type, interval_length):
             logging.info(f"✓ Successfully saved XML file to {filepath}")
             return filepath
         else:
@@ -460,51 +984,46 @@ class EntergyDataCollector:
                 date = datetime.now(central_tz)
 
             date_str = date.strftime('%Y-%m-%d')
-            date_formatted = date.strftime('%m%%2F%d%%2F%Y')
+            date_formatted = f"{date_str[5:7]}/{date_str[8:10]}/{date_str[0:4]}"
             odr_flag = "1" if trigger_read else "0"
 
-            url = (
-                f"https://myentergyadvisor.entergy.com/myenergy/odr-ajax"
-                f"?date={date_str}"
-                f"&custId={cust_id}"
-                f"&countHourly=1"
-                f"&useselectric=NO"
-                f"&usesgas=NO"
-                f"&usespropane=NO"
-                f"&useswater=NO"
-                f"&usesreclaim=NO"
-                f"&usesirrigation=NO"
-                f"&usesktg=NO"
-                f"&usesvoltage=NO"
-                f"&fuelType=E-AM12380287-{meter_id}"
-                f"&usageType=Q"
-                f"&timePeriod=DAILY"
-                f"&overlay_with=weather"
-                f"&select-time=00%3A00-02%3A59"
-                f"&select-date-to={date_formatted}"
-                f"&select-date-from={date_formatted}"
-                f"&show_demand=1"
-                f"&get_on_demand_read={odr_flag}"
-            )
+            # History-only reads are memoized briefly; triggered reads always
+            # go to the meter since that is their whole point
+            cache_key = (cust_id, meter_id, date_str)
+            if not trigger_read:
+                cached = self._odr_history_cache.get(cache_key)
+                if cached and time.monotonic() - cached[0] < self.ODR_HISTORY_TTL:
+                    logging.info("✓ Using recently fetched on-demand read data")
+                    return cached[1]
+
+            # requests URL-encodes the values (e.g. '/' and ':'), so they are passed raw
+            params = {
+                **ODR_STATIC_PARAMS,
+                "date": date_str,
+                "custId": cust_id,
+                "fuelType": f"E-AM12380287-{meter_id}",
+                "select-date-to": date_formatted,
+                "select-date-from": date_formatted,
+                "get_on_demand_read": odr_flag,
+            }
 
-            logging.info(f"Fetching on-demand read from: {url}")
-            response = self.session.get(url, timeout=30)
+            logging.info(f"Fetching on-demand read for {date_str} from: {self.odr_url}")
+            response = self.session.get(self.odr_url, params=params, timeout=self.timeout)
 
             if response.status_code == 200:
-                data = response.json()
+                data = _json_loads(response.content)
 
                 # The API ignores all date parameters and always returns full history
                 # Filter client-side to only include readings from the requested date
                 if 'registers' in data and data['registers']:
                     # API returns dates without leading zeros (e.g., "1/01/2026" not "01/01/2026")
-                    date_str_match = date.strftime('%-m/%d/%Y')  # Format: 1/01/2026
-                    filtered_registers = []
+                    date_str_match = f"{date.month}/{date.day:02d}/{date.year}"  # Format: 1/01/2026
 
-                    for register in data['registers']:
-                        timestamp = register.get('last_request_timestamp', '')
-                        # Only include registers from the requested date
-                        if timestamp.startswith(date_str_match):
-                            filtered_registers.append(register)
+                    # Only include registers from the requested date
+                    filtered_registers = [
+                        register for register in data['registers']
+                        if register.get('last_request_timestamp', '').startswith(date_str_match)
+                    ]
 
                     original_count = len(data['registers'])
                     data['registers'] = filtered_registers
@@ -512,6 +1031,8 @@ class EntergyDataCollector:
                 else:
                     logging.info(f"✓ Successfully retrieved on-demand read data")
 
+                if not trigger_read:
+                    self._odr_history_cache[cache_key] = (time.monotonic(), data)
                 return data
             else:
                 logging.error(f"✗ Error: HTTP {response.status_code}")
@@ -547,11 +1068,10 @@ class EntergyDataCollector:
                 date_str = date_for_filename.strftime('%Y%m%d')
                 filename = f"on_demand_{date_str}.json"
 
-            os.makedirs('data', exist_ok=True)
-            filepath = os.path.join('data', filename)
+            filepath = os.path.join(self._ensure_dir(self.output_dir), filename)
 
-            with open(filepath, 'w') as f:
-                json.dump(data, f, indent=2)
+            with open(filepath, 'wb') as f:
+                f.write(_json_dumps_pretty(data))
             logging.info(f"✓ Successfully saved on-demand read to {filepath}")
 
             # Log all readings from registers with deltas
@@ -596,6 +1116,7 @@ def main():
     parser.add_argument('--headless', action='store_true', help='Run authentication in headless mode (no GUI)')
     parser.add_argument('--verbose', action='store_true', help='Enable verbose auth logging')
     parser.add_argument('--manual', action='store_true', help='Pause for manual login button click (debug mode)')
+    parser.add_argument('--no-cache', action='store_true', help='Always re-download usage data for completed days')
     parser.add_argument('--poll', type=int, nargs='?', const=-1, metavar='MINUTES', help='Poll every N minutes (runs forever, default: from POLL_INTERVAL_MINUTES env var or 60)')
     args = parser.parse_args()
 
@@ -606,9 +1127,16 @@ def main():
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
 
+    # Completed days of usage data are cached next to the cookies file
+    cache_dir = None if args.no_cache else os.path.join(os.path.dirname(args.cookies) or '.', 'cache')
+
     # Helper function for authentication
     def authenticate():
-        """Perform authentication and save cookies."""
+        """Perform authentication and save cookies.
+
+        Returns:
+            list: The new cookies, or None if authentication failed
+        """
         logging.info("Authenticating to MyEntergy...")
         # Load credentials from environment
         load_dotenv()  # No-op if .env doesn't exist (e.g., in Docker)
@@ -619,8 +1147,10 @@ def main():
             logging.error("Error: MYENTERGY_USERNAME and MYENTERGY_PASSWORD must be set")
             logging.error(" Local: Create .env file with credentials")
             logging.error(" Docker: Ensure config/.env is mounted and loaded via env_file")
-            return False
+            return None
 
+        # Imported here so runs with valid cookies never load the browser stack
+        from myentergy_auth import MyEntergyAuth
         auth = MyEntergyAuth(
             username,
             password,
@@ -633,45 +1163,47 @@ def main():
             cookies = auth.login()
             auth.save_cookies(args.cookies)
             logging.info(f"✓ Authentication successful, cookies saved to {args.cookies}")
-            return True
+            return cookies
         except Exception as e:
             logging.error(f"✗ Authentication failed: {e}")
-            return False
+            return None
 
     # Helper function to calculate next scheduled run time
-    def get_next_scheduled_time(poll_interval):
-        """Calculate the next scheduled run time based on poll interval."""
-        now = datetime.now()
-        current_minute = now.minute
-        next_minute = ((current_minute // poll_interval) + 1) * poll_interval
-
-        if next_minute >= 60:
-            next_minute = 0
-            next_run = now.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
-        else:
-            next_run = now.replace(minute=next_minute, second=0, microsecond=0)
+    def get_next_scheduled_time(poll_interval, now=None):
+        """Calculate the next scheduled run time based on poll interval.
 
-        return next_run
+        Runs are aligned to multiples of poll_interval past the hour; past the
+        last one in an hour, the next run is at the top of the following hour.
+        The result is always strictly after now.
+        """
+        if now is None:
+            now = datetime.now()
+        next_minute = min(((now.minute // poll_interval) + 1) * poll_interval, 60)
+        return now.replace(minute=0, second=0, microsecond=0) + timedelta(minutes=next_minute)
 
     # Helper function for data collection (extracted for polling loop)
     def collect_data(collector, mqtt_publisher=None):
-        """Perform a single data collection cycle."""
+        """Perform a single data collection cycle.
+
+        Returns:
+            bool: False if the session could not be (re-)established
+        """
         # Verify session
         logging.info("Verifying session...")
         if not collector.verify_session():
             logging.error("✗ Session invalid or expired - attempting automatic re-authentication...")
-            if not authenticate():
+            cookies = authenticate()
+            if not cookies:
                 logging.error("✗ Automatic re-authentication failed")
-                return None
+                return False
 
-            # Reload cookies after successful auth
-            logging.info(f"Reloading cookies from {args.cookies}...")
-            collector = EntergyDataCollector(cookies_file=args.cookies)
+            # Use the fresh cookies directly rather than re-reading the file just saved
+            collector.reload_cookies(cookies=cookies)
 
             # Verify again
             if not collector.verify_session():
                 logging.error("✗ Session still invalid after re-authentication")
-                return None
+                return False
 
             logging.info("✓ Re-authentication successful")
         else:
@@ -681,47 +1213,59 @@ def main():
         central_tz = ZoneInfo('America/Chicago')
 
         if args.start_date and args.end_date:
-            # Parse dates as Central Time
-            start_date = datetime.strptime(args.start_date, '%Y-%m-%d').replace(tzinfo=central_tz)
-            end_date = datetime.strptime(args.end_date, '%Y-%m-%d').replace(tzinfo=central_tz)
-            # Ensure end_date is end of day
-            end_date = end_date.replace(hour=23, minute=59, second=59, microsecond=999999)
+            # Parse dates as Central Time, ending on the last instant of end_date
+            start_date, _ = _day_bounds(datetime.strptime(args.start_date, '%Y-%m-%d').date(), central_tz)
+            _, end_date = _day_bounds(datetime.strptime(args.end_date, '%Y-%m-%d').date(), central_tz)
         elif args.days:
-            end_date = datetime.now(central_tz).replace(hour=23, minute=59, second=59, microsecond=999999)
-            start_date = (end_date - timedelta(days=args.days)).replace(hour=0, minute=0, second=0, microsecond=0)
+            today = datetime.now(central_tz).date()
+            start_date, _ = _day_bounds(today - timedelta(days=args.days), central_tz)
+            _, end_date = _day_bounds(today, central_tz)
         else:
-            # Default to current full day in Central Time (midnight to current time or end of day)
-            now = datetime.now(central_tz)
-            start_date = now.replace(hour=0, minute=0, second=0, microsecond=0)
-            end_date = now.replace(hour=23, minute=59, second=59, microsecond=999999)
+            # Default to current full day in Central Time (midnight to end of day)
+            start_date, end_date = _day_bounds(datetime.now(central_tz).date(), central_tz)
 
         logging.info(f"Collecting data from {start_date.date()} to {end_date.date()}")
 
-        # Download based on format selection
-        if args.format in ['csv', 'both']:
-            # Collect CSV data
+        def collect_csv():
+            """Collect interval usage data and save it as CSV."""
             data = collector.get_usage_data(start_date, end_date)
             logging.info(f"✓ Collected {data['total_points']} total data points")
 
             # Save to CSV
             if data['total_points'] > 0:
                 logging.info(f"Saving to CSV files in {args.output}/...")
-                files = collector.save_to_csv(data, args.output)
+                files = collector.save_to_csv(data)
                 logging.info(f"✓ Created {len(files)} CSV file(s)")
             else:
                 logging.error("✗ No CSV data collected")
 
-        if args.format in ['xml', 'both']:
-            # Download and save Green Button XML data
+        def collect_xml():
+            """Download and save Green Button XML data."""
             logging.info("Downloading Green Button XML...")
             xml_file = collector.save_green_button_xml(start_date, end_date)
 
             if not xml_file:
                 logging.error("✗ Failed to retrieve Green Button XML data")
 
-        # Fetch on-demand read data for the current day
-        logging.info("Fetching on-demand meter read...")
-        odr_data = collector.get_on_demand_read(date=start_date, trigger_read=True)
+        # The CSV, XML and on-demand read endpoints are independent, so fetch
+        # them concurrently; wall time becomes that of the slowest endpoint
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = []
+            if args.format in ['csv', 'both']:
+                futures.append(executor.submit(collect_csv))
+            if args.format in ['xml', 'both']:
+                futures.append(executor.submit(collect_xml))
+
+            # Fetch on-demand read data for the current day
+            logging.info("Fetching on-demand meter read...")
+            odr_future = executor.submit(collector.get_on_demand_read, date=start_date, trigger_read=True)
+            futures.append(odr_future)
+
+            # Surface any unexpected exception from a worker
+            for future in as_completed(futures):
+                future.result()
+
+        odr_data = odr_future.result()
 
         # Save to file (reusing already-fetched data)
         if odr_data:
@@ -734,14 +1278,15 @@ def main():
             try:
                 if 'registers' in odr_data and len(odr_data['registers']) > 0:
                     # Get most recent reading with valid odr_amt
-                    for register in odr_data['registers']:
-                        if register.get('odr_amt') is not None:
-                            odr_amt = register['odr_amt']
-                            # Use Unix timestamp from API (timezone-agnostic)
-                            unix_ts = register['last_request_unix_timestamp']
-                            timestamp = datetime.fromtimestamp(unix_ts, tz=timezone.utc)
-                            mqtt_publisher.publish_meter_reading(odr_amt, timestamp)
-                            break
+                    register = next(
+                        (r for r in odr_data['registers'] if r.get('odr_amt') is not None),
+                        None
+                    )
+                    if register is not None:
+                        # Use Unix timestamp from API (timezone-agnostic)
+                        unix_ts = register['last_request_unix_timestamp']
+                        timestamp = datetime.fromtimestamp(unix_ts, tz=timezone.utc)
+                        mqtt_publisher.publish_meter_reading(register['odr_amt'], timestamp)
                     else:
                         logging.warning("No valid meter reading found in registers")
                 else:
@@ -749,7 +1294,7 @@ def main():
             except Exception as e:
                 logging.error(f"✗ MQTT publish failed: {e}")
 
-        return collector
+        return True
 
     # Authenticate if requested or cookies missing
     if args.auth or not os.path.exists(args.cookies):
@@ -764,7 +1309,7 @@ def main():
 
     # Initialize collector
     logging.info(f"Loading cookies from {args.cookies}...")
-    collector = EntergyDataCollector(cookies_file=args.cookies)
+    collector = EntergyDataCollector(cookies_file=args.cookies, cache_dir=cache_dir, output_dir=args.output)
 
     # Initialize MQTT publisher if enabled
     mqtt_publisher = None
@@ -832,6 +1377,11 @@ def main():
 
         logging.info("Press Ctrl+C to stop")
 
+        # SIGTERM (docker stop, systemd) wakes the poll loop's sleep immediately and
+        # ends the loop after any collection in progress, so cleanup still runs
+        shutdown = threading.Event()
+        signal.signal(signal.SIGTERM, lambda signum, frame: shutdown.set())
+
         iteration = 0
         try:
             # Handle initial sync to schedule
@@ -845,49 +1395,42 @@ def main():
                 logging.info("Starting immediately (on schedule)")
             else:
                 # Sleep until next scheduled time
-                next_run = get_next_scheduled_time(poll_interval)
+                next_run = get_next_scheduled_time(poll_interval, now)
                 sleep_seconds = (next_run - now).total_seconds()
                 logging.info(f"First run will be at {next_run.strftime('%H:%M:%S')}")
                 logging.info(f"Sleeping for {sleep_seconds:.0f} seconds...")
-                time.sleep(sleep_seconds)
+                shutdown.wait(sleep_seconds)
 
-            while True:
+            while not shutdown.is_set():
                 iteration += 1
+                cycle_started = time.monotonic()
                 logging.info("=" * 60)
                 logging.info(f"Poll iteration #{iteration} - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
                 logging.info("=" * 60)
 
-                collector = collect_data(collector, mqtt_publisher)
-                if collector is None:
+                if not collect_data(collector, mqtt_publisher):
                     logging.error("✗ Collection failed, will retry on next poll")
 
-                # Calculate exact sleep time to next scheduled run (accounts for execution time)
-                next_run = get_next_scheduled_time(poll_interval)
-                sleep_seconds = (next_run - datetime.now()).total_seconds()
-
-                # If we're behind schedule (collection took too long), keep advancing until positive
-                while sleep_seconds < 0:
-                    logging.warning(f"Collection took longer than poll interval, advancing to next scheduled time")
-                    # Manually advance to next interval since we're already past next_run
-                    current_minute = datetime.now().minute
-                    next_minute = ((current_minute // poll_interval) + 1) * poll_interval
-                    if next_minute >= 60:
-                        next_run = datetime.now().replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
-                    else:
-                        next_run = datetime.now().replace(minute=next_minute, second=0, microsecond=0)
-                    sleep_seconds = (next_run - datetime.now()).total_seconds()
+                # Sleep until the next scheduled run after now (accounts for execution
+                # time); any runs missed during a long collection are skipped
+                if time.monotonic() - cycle_started > poll_interval * 60:
+                    logging.warning("Collection took longer than poll interval, advancing to next scheduled time")
+                now = datetime.now()
+                next_run = get_next_scheduled_time(poll_interval, now)
+                sleep_seconds = (next_run - now).total_seconds()
 
                 logging.info("=" * 60)
                 logging.info(f"Next run at {next_run.strftime('%H:%M:%S')} (sleeping {sleep_seconds:.0f}s)")
                 logging.info("=" * 60)
-                time.sleep(sleep_seconds)
+                shutdown.wait(sleep_seconds)
+
+            logging.info("Polling stopped (received SIGTERM)")
         except KeyboardInterrupt:
             logging.info("Polling stopped by user")
             return 0
     else:
         # Single run mode (original behavior)
-        collector = collect_data(collector, mqtt_publisher)
-        if collector is None:
+        if not collect_data(collector, mqtt_publisher):
             return 1
 
     # Cleanup MQTT connection
@@ -1,6 +1,8 @@
 import logging
 from datetime import datetime, timedelta
 from typing import Optional
+import paho.mqtt.client as mqtt
+from paho.mqtt.enums import CallbackAPIVersion
 from ha_mqtt_discoverable import Settings, DeviceInfo
 from ha_mqtt_discoverable.sensors import Sensor, SensorInfo
 
@@ -27,13 +29,23 @@ class MQTTPublisher:
         # Create short meter ID for unique IDs (last 8 chars)
         self.meter_id_short = self.meter_id[-8:]
 
+        # One broker connection shared by both sensors; without a client,
+        # ha-mqtt-discoverable would open a separate connection per sensor
+        self.client = mqtt.Client(callback_api_version=CallbackAPIVersion.VERSION2)
         try:
+            if username:
+                self.client.username_pw_set(username, password=password)
+            if self.client.connect(host, port) != mqtt.MQTT_ERR_SUCCESS:
+                raise RuntimeError(f"Error while connecting to MQTT broker at {host}:{port}")
+            self.client.loop_start()
+
             # Configure MQTT settings
             mqtt_settings = Settings.MQTT(
                 host=host,
                 port=port,
                 username=username,
-                password=password
+                password=password,
+                client=self.client
             )
 
             # Create device info
@@ -71,6 +83,9 @@ class MQTTPublisher:
 
         except Exception as e:
             self.logger.error(f"✗ Failed to initialize MQTT Publisher: {e}")
+            # Don't leave the network loop thread running behind a failed init
+            self.client.disconnect()
+            self.client.loop_stop()
             raise
 
     def publish_meter_reading(self, odr_amt: float, timestamp: datetime) -> bool:
@@ -101,7 +116,9 @@ class MQTTPublisher:
     def close(self):
         """Close MQTT connections gracefully."""
         try:
-            # ha-mqtt-discoverable handles cleanup internally
+            # The shared client is ours, so ha-mqtt-discoverable won't close it
+            self.client.disconnect()
+            self.client.loop_stop()
             self.logger.info("MQTT Publisher closed")
         except Exception as e:
             self.logger.warning(f"Error closing MQTT Publisher: {e}")
@@ -3,13 +3,18 @@ import os
 import time
 import logging
 from DrissionPage import ChromiumPage, ChromiumOptions
-from RecaptchaSolver import RecaptchaSolver
+from RecaptchaSolver import RecaptchaSolver, _noop
 from dotenv import load_dotenv
 try:
     from pyvirtualdisplay import Display
     PYVIRTUALDISPLAY_AVAILABLE = True
 except ImportError:
     PYVIRTUALDISPLAY_AVAILABLE = False
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 
 CHROME_ARGUMENTS = [
@@ -33,11 +38,35 @@ CHROME_ARGUMENTS = [
     "--disable-software-rasterizer"
 ]
 
+# Login form locators
+_LOC_PASSWORD_INPUT = 'xpath://input[@type="password"]'
+_LOC_CREDENTIAL_INPUTS = (
+    'xpath://input[not(@type) or @type="" or @type="text" or @type="password" or @type="email"]'
+)
+_LOC_LOGIN_BUTTON = 'xpath://button[normalize-space()="Login"]'
+
+# Advisor usage page; its custId field only renders once the advisor session exists
+_ADVISOR_USAGE_URL = "https://myentergyadvisor.entergy.com/myenergy/usage-history"
+_ADVISOR_USAGE_PATH = "myentergyadvisor.entergy.com/myenergy/usage-history"
+_LOC_ADVISOR_CUST_ID = '@name=custId'
+
+# True once a Login button exists and is no longer disabled
+_JS_LOGIN_BUTTON_ENABLED = """
+    return Array.from(document.querySelectorAll('button'))
+        .some(btn => btn.textContent.trim() === 'Login' && !btn.disabled);
+"""
+
 
 class MyEntergyAuth:
     """Handles authentication for MyEntergy website."""
 
     DEBUG_DIR = "./debug"
+    # Seconds to wait for page transitions during login
+    TIMEOUT_FORM = 10
+    TIMEOUT_BUTTON = 5
+    TIMEOUT_REDIRECT = 15
+    # Seconds the URL must stay unchanged before a redirect chain counts as done
+    REDIRECT_SETTLE = 3
 
     def __init__(self, username: str, password: str, headless: bool = False, verbose: bool = False, manual_mode: bool = False):
         """Initialize the auth handler.
@@ -59,18 +88,20 @@ class MyEntergyAuth:
         self.cookies = None
         self.display = None
 
-        # Create debug directory if verbose mode is enabled
+        # Create debug directory if verbose mode is enabled; otherwise the debug
+        # hooks become no-ops so login() skips their checks entirely
         if self.verbose:
             os.makedirs(self.DEBUG_DIR, exist_ok=True)
+        else:
+            self._log = self._take_screenshot = self._log_page_state = _noop
 
     def _log(self, message: str) -> None:
         """Log message if verbose mode is enabled."""
-        if self.verbose:
-            logging.debug(message)
+        logging.debug(message)
 
     def _take_screenshot(self, name: str) -> None:
         """Take a screenshot for debugging (verbose mode only)."""
-        if self.driver and self.verbose:
+        if self.driver:
             try:
                 filename = os.path.join(self.DEBUG_DIR, f"debug_{name}.png")
                 self.driver.get_screenshot(path=filename)
@@ -80,7 +111,7 @@ class MyEntergyAuth:
 
     def _log_page_state(self, label: str) -> None:
         """Log current page state for debugging (verbose mode only)."""
-        if self.driver and self.verbose:
+        if self.driver:
             try:
                 url = self.driver.url
                 title = self.driver.title
@@ -106,6 +137,42 @@ class MyEntergyAuth:
             };
         """)
 
+    def _wait_for_login_button(self, timeout: float) -> bool:
+        """Poll until the Login button is enabled or the timeout expires.
+
+        Args:
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            bool: True if the button became enabled
+        """
+        deadline = time.monotonic() + timeout
+        while not self.driver.run_js(_JS_LOGIN_BUTTON_ENABLED):
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.1)
+        return True
+
+    def _wait_for_redirects(self, url: str, timeout: float) -> str:
+        """Follow a redirect chain until the URL stops changing.
+
+        Args:
+            url: URL to treat as the start of the chain
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            str: The URL the chain settled on
+        """
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline and self.driver.wait.url_change(
+                url, exclude=True, timeout=max(0.1, min(self.REDIRECT_SETTLE, deadline - time.monotonic()))):
+            new_url = self.driver.url
+            self._log("URL changed again:")
+            self._log(f"  From: {url}")
+            self._log(f"  To:   {new_url}")
+            url = new_url
+        return url
+
     def login(self) -> dict:
         """Perform login and return session cookies.
 
@@ -158,8 +225,8 @@ class MyEntergyAuth:
         try:
             # Navigate to login page
             self._log("Navigating to MyEntergy login page...")
+            # get() returns once the document has loaded; the solver waits for its iframe
             self.driver.get("https://www.myentergy.com/s/login/")
-            time.sleep(2)
             self._log_page_state("After navigation")
             self._take_screenshot("01_after_navigation")
 
@@ -167,29 +234,23 @@ class MyEntergyAuth:
             self._log("Solving reCAPTCHA...")
             recaptcha_solver = RecaptchaSolver(self.driver, verbose=self.verbose)
             recaptcha_solver.solveCaptcha()
-            time.sleep(2)
+            self.driver.wait.ele_displayed(_LOC_PASSWORD_INPUT, timeout=self.TIMEOUT_FORM)
             self._log_page_state("After captcha")
             self._take_screenshot("02_after_captcha")
 
-            # Find form input fields - filter by type to avoid hidden fields
+            # Find form input fields - the locator filters by type to avoid hidden
+            # fields, so no per-element attribute round-trips are needed
             self._log("Finding input fields...")
-            all_inputs = self.driver.eles('tag:input', timeout=10)
-
-            # Filter to visible text/password fields only
-            visible_inputs = []
-            for inp in all_inputs:
-                inp_type = inp.attr('type') or 'text'
-                if inp_type in ('text', 'password', 'email'):
-                    visible_inputs.append(inp)
+            visible_inputs = self.driver.eles(_LOC_CREDENTIAL_INPUTS, timeout=self.TIMEOUT_FORM)
 
             if len(visible_inputs) < 2:
                 raise Exception(f"Expected at least 2 visible input fields, found {len(visible_inputs)}")
 
-            self._log(f"Found {len(all_inputs)} total input fields, {len(visible_inputs)} visible")
+            self._log(f"Found {len(visible_inputs)} visible input fields")
 
             # Log field details in verbose mode
             if self.verbose:
-                for i, inp in enumerate(all_inputs):
+                for i, inp in enumerate(visible_inputs):
                     try:
                         inp_type = inp.attr('type') or 'text'
                         inp_name = inp.attr('name') or 'no-name'
@@ -201,14 +262,12 @@ class MyEntergyAuth:
             self._log("Entering username...")
             username_field = visible_inputs[0]
             username_field.input(self.username)
-            time.sleep(0.5)
             self._take_screenshot("03_after_username")
 
             # Fill password (second visible field)
             self._log("Entering password...")
             password_field = visible_inputs[1]
             password_field.input(self.password)
-            time.sleep(0.5)
             self._take_screenshot("04_after_password")
 
             # Blur password field to enable Login button
@@ -223,7 +282,9 @@ class MyEntergyAuth:
             # Trigger blur using DrissionPage element reference (works in Shadow DOM)
             password_field.run_js('this.blur();')
             self._log("Password field blurred")
-            time.sleep(1)  # Wait for blur event handlers to enable button
+            # Wait for blur event handlers to enable button
+            if not self._wait_for_login_button(self.TIMEOUT_BUTTON):
+                self._log("Login button not enabled after blur, continuing anyway")
 
             if self.verbose:
                 button_state_after = self._get_button_state()
@@ -246,30 +307,23 @@ class MyEntergyAuth:
                 url_before = self.driver.url
                 self._log(f"URL before manual click: {url_before}")
 
-                # Monitor for URL change
+                # Monitor for URL change; each wait returns as soon as the URL
+                # changes, and times out every 5 s only to report progress
                 logging.info("Waiting for login button click (monitoring URL changes)...")
-                for i in range(60):
-                    time.sleep(1)
-                    current_url = self.driver.url
-                    if current_url != url_before:
-                        self._log(f"URL CHANGED after {i+1} seconds!")
+                started = time.monotonic()
+                for elapsed in range(5, 65, 5):
+                    if self.driver.wait.url_change(url_before, exclude=True, timeout=5):
+                        current_url = self.driver.url
+                        self._log(f"URL CHANGED after {time.monotonic() - started:.1f} seconds!")
                         self._log(f"  From: {url_before}")
                         self._log(f"  To:   {current_url}")
 
-                        # Monitor for additional redirects
-                        logging.info("Login detected! Monitoring for 10 more seconds...")
-                        url_before = current_url
-                        for j in range(10):
-                            time.sleep(1)
-                            new_url = self.driver.url
-                            if new_url != url_before:
-                                self._log(f"URL changed again after {j+1} more seconds:")
-                                self._log(f"  From: {url_before}")
-                                self._log(f"  To:   {new_url}")
-                                url_before = new_url
+                        # Monitor for additional redirects until the URL has settled
+                        logging.info("Login detected! Monitoring for further redirects...")
+                        self._wait_for_redirects(current_url, timeout=10)
                         break
-                    elif i % 5 == 0 and i > 0:
-                        logging.info(f"Still waiting... ({i} seconds elapsed)")
+                    elif elapsed < 60:
+                        logging.info(f"Still waiting... ({elapsed} seconds elapsed)")
 
                 self._log_page_state("After manual login")
                 self._take_screenshot("05_after_manual_login")
@@ -279,23 +333,11 @@ class MyEntergyAuth:
                 # Automated login - click the Login button
                 self._log("Clicking login button...")
 
-                # Find Login button
-                buttons = self.driver.eles('tag:button')
-                login_button = None
-
-                for i, btn in enumerate(buttons):
-                    try:
-                        btn_text = btn.text.strip()
-                        self._log(f"Found button {i}: '{btn_text}'")
-                        if btn_text == 'Login':
-                            login_button = btn
-                            self._log(f"Found Login button at index {i}")
-                            break
-                    except:
-                        pass
-
+                # Find Login button by its text in one query
+                login_button = self.driver.ele(_LOC_LOGIN_BUTTON, timeout=self.TIMEOUT_BUTTON)
                 if not login_button:
                     raise Exception("Could not find Login button")
+                self._log("Found Login button")
 
                 # Click the button
                 url_before_click = self.driver.url
@@ -303,7 +345,7 @@ class MyEntergyAuth:
 
                 login_button.click()
                 self._log("Click completed")
-                time.sleep(0.5)
+                self.driver.wait.url_change(url_before_click, exclude=True, timeout=self.TIMEOUT_BUTTON)
 
                 # Verify URL changed (indicates successful form submission)
                 url_after_click = self.driver.url
@@ -317,16 +359,16 @@ class MyEntergyAuth:
 
                 current_url = url_after_click
 
-            # Wait for login to complete
-            time.sleep(1)
             self._take_screenshot("05_after_button_click")
 
-            # Wait for redirects to complete
+            # Wait for redirects to leave the login page, then follow the rest of
+            # the chain until the URL settles; the first hop away from /login is
+            # not yet the landing page
             self._log("Waiting for login to complete...")
-            time.sleep(3)
-            self._log_page_state("3 seconds after click")
-            time.sleep(3)
-            self._log_page_state("6 seconds after click")
+            if self.driver.wait.url_change('/login', exclude=True, timeout=self.TIMEOUT_REDIRECT):
+                self._wait_for_redirects(self.driver.url, timeout=self.TIMEOUT_REDIRECT)
+            self.driver.wait.doc_loaded(timeout=self.TIMEOUT_FORM)
+            self._log_page_state("After login redirects")
             self._take_screenshot("06_after_wait")
 
             # Verify login succeeded
@@ -343,8 +385,14 @@ class MyEntergyAuth:
 
             # Navigate to advisor page to get session cookies
             self._log("Navigating to MyEntergy Advisor to establish session...")
-            self.driver.get("https://myentergyadvisor.entergy.com/myenergy/usage-history")
-            time.sleep(3)
+            self.driver.get(_ADVISOR_USAGE_URL)
+            # get() returns once the first document loads, but the advisor SSO
+            # handshake redirects through other pages before landing on the usage
+            # page; cookies are only complete once its form has rendered
+            if not (self.driver.wait.url_change(_ADVISOR_USAGE_PATH, timeout=self.TIMEOUT_REDIRECT)
+                    and self.driver.wait.eles_loaded(_LOC_ADVISOR_CUST_ID, timeout=self.TIMEOUT_REDIRECT)):
+                logging.warning(f"Advisor usage page did not finish loading; session cookies may be incomplete "
+                                f"(URL: {self.driver.url})")
             self._log_page_state("After advisor navigation")
             self._take_screenshot("08_advisor_page")
 
@@ -404,8 +452,12 @@ class MyEntergyAuth:
         if dirname:
             os.makedirs(dirname, exist_ok=True)
 
-        with open(filepath, 'w') as f:
-            json.dump(self.cookies, f, indent=2)
+        if ORJSON_AVAILABLE:
+            content = orjson.dumps(self.cookies, option=orjson.OPT_INDENT_2)
+        else:
+            content = json.dumps(self.cookies, indent=2).encode('utf-8')
+        with open(filepath, 'wb') as f:
+            f.write(content)
 
         self._log(f"Cookies saved to {filepath}")
 
@@ -419,8 +471,11 @@ class MyEntergyAuth:
         Returns:
             list: List of cookie dictionaries
         """
-        with open(filepath, 'r') as f:
-            return json.load(f)
+        with open(filepath, 'rb') as f:
+            content = f.read()
+        if ORJSON_AVAILABLE:
+            return orjson.loads(content)
+        return json.loads(content)
 
 
 def main():